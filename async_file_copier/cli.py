@@ -32,8 +32,10 @@ async def run(origin: str, destination: str, dry_run: bool = False):
     else:
         await mkdir_async(dest_dir, parents=True, exist_ok=True)
 
-    await copy_code_and_task_files(dirs_structure, dry_run)
-    await create_mod_files(dirs_structure, dry_run)
+    await asyncio.gather(
+        copy_code_and_task_files(dirs_structure, dry_run),
+        create_mod_files(dirs_structure, dry_run),
+    )
     # await create_main_file(dest_dir, dirs_structure, dry_run)
 
 
@@ -41,6 +43,13 @@ def main():
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     args = parse_args()
 
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(run(args.origin, args.destination, args.dry_run))
 
 
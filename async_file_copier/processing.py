@@ -1,22 +1,49 @@
 import asyncio
+import functools
 import logging
+import os
 import re
+import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
-import aiofiles
+EXCLUDED_FOLDERS = frozenset({".cargo", ".idea", "target"})
 
-EXCLUDED_FOLDERS = [".cargo", ".idea", "target"]
+_RE_WS = re.compile(r"\s+")
+_RE_DASH = re.compile(r"-+")
+_RE_NONWORD = re.compile(r"[^\w_]")
 
+MAX_CONCURRENT_FILE_OPS = 64
 
-@dataclass(frozen=True)
-class PathMapping:
-    source: Path
-    dest: Path
+COPY_BATCH_SIZE = 128
+
+_semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+_created_dirs: Set[str] = set()
+
+
+def _ensure_parent_dir(dest_file: str | Path):
+    """Create the parent directory once; repeat calls for siblings are free."""
+    parent = os.path.dirname(dest_file)
+    if parent not in _created_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _created_dirs.add(parent)
 
-    def __lt__(self, other: "PathMapping") -> bool:
-        return self.dest.name < other.dest.name
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the file-operation semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_FILE_OPS)
+    return semaphore
+
+
+@dataclass(frozen=True, slots=True)
+class PathMapping:
+    source: str
+    dest: str
 
 
 @dataclass
@@ -26,34 +53,64 @@ class DirectoriesStructure:
     )
 
 
+def _list_subdirs(path: str | Path) -> List[str]:
+    """List child directories via os.scandir, reusing the cached entry type."""
+    with os.scandir(path) as entries:
+        return [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+
+
 async def collect_dirs_structure(
     origin_dir: Path,
     dest_dir: Path,
 ) -> DirectoriesStructure:
     result = {}
     first_level_dirs = [
-        d for d in origin_dir.iterdir() if d.is_dir() and d.name not in EXCLUDED_FOLDERS
+        d
+        for d in await asyncio.to_thread(_list_subdirs, origin_dir)
+        if os.path.basename(d) not in EXCLUDED_FOLDERS
     ]
-    for first_level_dir in first_level_dirs:
-        first_level_mapping = PathMapping(
-            source=first_level_dir,
-            dest=dest_dir / to_snake_case(first_level_dir.name),
+    second_level_lists = await asyncio.gather(
+        *[asyncio.to_thread(_list_subdirs, d) for d in first_level_dirs]
+    )
+    for first_level_dir, second_level_dirs in zip(first_level_dirs, second_level_lists):
+        first_level_dest = os.path.join(
+            dest_dir, to_snake_case(os.path.basename(first_level_dir))
         )
+        first_level_mapping = PathMapping(source=first_level_dir, dest=first_level_dest)
         result[first_level_mapping] = {}
-        second_level_dirs = [d for d in first_level_dir.iterdir() if d.is_dir()]
-        for second_level_dir in second_level_dirs:
+        third_level_lists = await asyncio.gather(
+            *[asyncio.to_thread(_list_subdirs, d) for d in second_level_dirs]
+        )
+        # Inner dicts and lists are kept sorted by destination name here so
+        # consumers like create_mod_files never have to re-sort them.
+        second_level_map = {}
+        for second_level_dir, third_level_dirs in zip(
+            second_level_dirs, third_level_lists
+        ):
+            second_level_dest = os.path.join(
+                first_level_dest, to_snake_case(os.path.basename(second_level_dir))
+            )
             second_level_mapping = PathMapping(
-                source=second_level_dir,
-                dest=first_level_mapping.dest / to_snake_case(second_level_dir.name),
+                source=second_level_dir, dest=second_level_dest
             )
-            result[first_level_mapping][second_level_mapping] = [
-                PathMapping(
-                    source=d,
-                    dest=second_level_mapping.dest / to_snake_case(d.name),
-                )
-                for d in second_level_dir.iterdir()
-                if d.is_dir()
-            ]
+            second_level_map[second_level_mapping] = sorted(
+                (
+                    PathMapping(
+                        source=d,
+                        dest=os.path.join(
+                            second_level_dest, to_snake_case(os.path.basename(d))
+                        ),
+                    )
+                    for d in third_level_dirs
+                ),
+                key=lambda mapping: os.path.basename(mapping.dest),
+            )
+        result[first_level_mapping] = dict(
+            sorted(
+                second_level_map.items(),
+                key=lambda item: os.path.basename(item[0].dest),
+            )
+        )
 
     return DirectoriesStructure(result)
 
@@ -69,35 +126,47 @@ async def copy_code_and_task_files(
             third_level_dirs,
         ) in second_level_to_third_level_dir.items():
             for third_level_dir in third_level_dirs:
-                source_main_file = third_level_dir.source / "src" / "main.rs"
-                dest_main_file = third_level_dir.dest.with_suffix(".rs")
-                if not await file_exists(dest_main_file):
-                    tasks.append(copy_file(source_main_file, dest_main_file, dry_run))
+                source_main_file = os.path.join(
+                    third_level_dir.source, "src", "main.rs"
+                )
+                dest_main_file = third_level_dir.dest + ".rs"
+                source_task_file = os.path.join(third_level_dir.source, "task.md")
+                dest_task_file = third_level_dir.dest + ".md"
 
-                source_task_file = third_level_dir.source / "task.md"
-                dest_task_file = third_level_dir.dest.with_suffix(".md")
-                if not await file_exists(dest_main_file):
-                    tasks.append(copy_file(source_task_file, dest_task_file, dry_run))
+                if dry_run:
+                    logging.info(
+                        f"[DRY RUN] Would copy {source_main_file} to {dest_main_file}"
+                    )
+                    logging.info(
+                        f"[DRY RUN] Would copy {source_task_file} to {dest_task_file}"
+                    )
+                else:
+                    tasks.append(copy_file(source_main_file, dest_main_file))
+                    tasks.append(copy_file(source_task_file, dest_task_file))
 
-    await asyncio.gather(*tasks)
+    for start in range(0, len(tasks), COPY_BATCH_SIZE):
+        await asyncio.gather(*tasks[start : start + COPY_BATCH_SIZE])
 
 
 async def create_mod_files(dirs_struct: DirectoriesStructure, dry_run: bool = False):
     tasks = []
 
     for first_level_dir, second_level_to_third_level_dir in dirs_struct.dirs.items():
-        content = "\n\n".join(
-            f"pub mod {second_level_dir.dest.name} {{\n"
-            + "\n".join(
-                f"    pub mod {third_level_dir.dest.name};"
-                for third_level_dir in sorted(third_level_dirs)
-            )
-            + "\n}"
-            for second_level_dir, third_level_dirs in sorted(
-                second_level_to_third_level_dir.items()
-            )
-        )
-        dest_mod_file = first_level_dir.dest / "mod.rs"
+        parts = []
+        for (
+            second_level_dir,
+            third_level_dirs,
+        ) in second_level_to_third_level_dir.items():
+            if parts:
+                parts.append("")
+            parts.append("pub mod " + os.path.basename(second_level_dir.dest) + " {")
+            for third_level_dir in third_level_dirs:
+                parts.append(
+                    "    pub mod " + os.path.basename(third_level_dir.dest) + ";"
+                )
+            parts.append("}")
+        content = "\n".join(parts)
+        dest_mod_file = os.path.join(first_level_dir.dest, "mod.rs")
         tasks.append(write_to_file(dest_mod_file, content, dry_run))
 
     await asyncio.gather(*tasks)
@@ -109,41 +178,47 @@ async def create_main_file(
     content = ["#![allow(dead_code)]"]
 
     content.extend(
-        f"mod {first_level_dir.dest.name};"
+        "mod " + os.path.basename(first_level_dir.dest) + ";"
         for first_level_dir in dirs_struct.dirs.keys()
     )
 
     content.append("\nfn main() {")
 
     for first_level_dir, second_level_to_third_level_dir in dirs_struct.dirs.items():
-        content.append(f"    // {first_level_dir.source.name.upper()}")
+        first_level_name = os.path.basename(first_level_dir.dest)
+        content.append("    // " + os.path.basename(first_level_dir.source).upper())
         for (
             second_level_dir,
             third_level_dirs,
         ) in second_level_to_third_level_dir.items():
-            content.append(f"    // {second_level_dir.source.name.upper()}")
+            second_level_name = os.path.basename(second_level_dir.dest)
+            content.append(
+                "    // " + os.path.basename(second_level_dir.source).upper()
+            )
+            prefix = "    // " + first_level_name + "::" + second_level_name + "::"
             for third_level_dir in third_level_dirs:
                 content.append(
-                    f"    // {first_level_dir.dest.name}::{second_level_dir.dest.name}::{third_level_dir.dest.name}::main();"
+                    prefix + os.path.basename(third_level_dir.dest) + "::main();"
                 )
     content.append("}")
-    main_file = dest_dir / "main.rs"
+    main_file = os.path.join(dest_dir, "main.rs")
     await write_to_file(main_file, "\n".join(content), dry_run)
 
 
+@functools.lru_cache(maxsize=4096)
 def to_snake_case(name):
     """Convert a string to snake_case"""
     s = name.replace(",", "")
-    s = re.sub(r"\s+", "_", s)
-    s = re.sub(r"-+", "_", s)
-    s = re.sub(r"[^\w_]", "", s)
+    s = _RE_WS.sub("_", s)
+    s = _RE_DASH.sub("_", s)
+    s = _RE_NONWORD.sub("", s)
     s = s.lower()
     return s
 
 
-async def file_exists(path: Path) -> bool:
-    """Check if a file exists (run in a thread to avoid blocking)."""
-    return await asyncio.to_thread(lambda: path.exists())
+def file_exists(path: str | Path) -> bool:
+    """Check if a file exists (a single stat is cheaper than a thread hop)."""
+    return os.path.exists(path)
 
 
 async def mkdir_async(path: Path, parents=True, exist_ok=True):
@@ -151,28 +226,37 @@ async def mkdir_async(path: Path, parents=True, exist_ok=True):
     await asyncio.to_thread(path.mkdir, parents=parents, exist_ok=exist_ok)
 
 
-async def copy_file(source_file: Path, dest_file: Path, dry_run: bool = False):
-    if await file_exists(source_file):
-        if dry_run:
-            logging.info(f"[DRY RUN] Would copy {source_file} to {dest_file}")
-        else:
-            await mkdir_async(dest_file.parent, parents=True, exist_ok=True)
+def _sync_copy(source_file: str, dest_file: str) -> bool:
+    """Check the source, create the parent and copy in one thread hop."""
+    if not os.path.exists(source_file):
+        return False
+    _ensure_parent_dir(dest_file)
+    shutil.copyfile(source_file, dest_file)
+    return True
 
-            async with aiofiles.open(source_file, mode="r") as f:
-                content = await f.read()
 
-            async with aiofiles.open(dest_file, mode="w") as f:
-                await f.write(content)
-                logging.info(f"Copied {source_file} to {dest_file}")
+async def copy_file(source_file: str, dest_file: str, dry_run: bool = False):
+    if dry_run:
+        logging.info(f"[DRY RUN] Would copy {source_file} to {dest_file}")
     else:
-        logging.warning(f"File not found: {source_file}")
+        async with _get_semaphore():
+            copied = await asyncio.to_thread(_sync_copy, source_file, dest_file)
+        if copied:
+            logging.info(f"Copied {source_file} to {dest_file}")
+        else:
+            logging.warning(f"File not found: {source_file}")
+
 
+def _sync_write(dest_file: str | Path, content: str):
+    """Create the parent and write the content in one thread hop."""
+    _ensure_parent_dir(dest_file)
+    with open(dest_file, mode="w") as f:
+        f.write(content)
 
-async def write_to_file(dest_file: Path, content: str, dry_run: bool = False):
+
+async def write_to_file(dest_file: str | Path, content: str, dry_run: bool = False):
     if dry_run:
         logging.info(f"[DRY RUN] Would write to {dest_file} file, content:\n{content}")
     else:
-        await mkdir_async(dest_file.parent, parents=True, exist_ok=True)
-
-        async with aiofiles.open(dest_file, mode="w") as f:
-            await f.write(content)
+        async with _get_semaphore():
+            await asyncio.to_thread(_sync_write, dest_file, content)
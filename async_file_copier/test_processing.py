@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 import pytest
 
 from async_file_copier.processing import (
@@ -45,16 +48,16 @@ async def test_collect_dirs_structure(tmp_path):
 
     assert len(dirs_struct.dirs) == 1
     first_level = next(iter(dirs_struct.dirs.keys()))
-    assert first_level.source == first
-    assert first_level.dest == dest / "first_module"
+    assert first_level.source == str(first)
+    assert first_level.dest == str(dest / "first_module")
 
     second_level = next(iter(dirs_struct.dirs[first_level].keys()))
-    assert second_level.source == second
-    assert second_level.dest == first_level.dest / "second_module"
+    assert second_level.source == str(second)
+    assert second_level.dest == os.path.join(first_level.dest, "second_module")
 
     third_level = dirs_struct.dirs[first_level][second_level][0]
-    assert third_level.source == third
-    assert third_level.dest == second_level.dest / "third_module"
+    assert third_level.source == str(third)
+    assert third_level.dest == os.path.join(second_level.dest, "third_module")
 
 
 @pytest.mark.asyncio
@@ -70,9 +73,9 @@ async def test_copy_code_and_task_files(tmp_path):
     (src_dir / "main.rs").write_text("fn main() {}")
     (third / "task.md").write_text("Task content")
 
-    third_mapping = PathMapping(source=third, dest=dest_root / "third_module")
+    third_mapping = PathMapping(source=str(third), dest=str(dest_root / "third_module"))
     second_mapping = PathMapping(
-        source=tmp_path / "Second", dest=dest_root / "second_module"
+        source=str(tmp_path / "Second"), dest=str(dest_root / "second_module")
     )
     dirs_struct = DirectoriesStructure(
         {second_mapping: {second_mapping: [third_mapping]}}
@@ -80,10 +83,12 @@ async def test_copy_code_and_task_files(tmp_path):
 
     await copy_code_and_task_files(dirs_struct, dry_run=False)
 
-    assert (third_mapping.dest.with_suffix(".rs")).exists()
-    assert (third_mapping.dest.with_suffix(".md")).exists()
-    assert (third_mapping.dest.with_suffix(".rs")).read_text() == "fn main() {}"
-    assert (third_mapping.dest.with_suffix(".md")).read_text() == "Task content"
+    dest_rs = Path(third_mapping.dest + ".rs")
+    dest_md = Path(third_mapping.dest + ".md")
+    assert dest_rs.exists()
+    assert dest_md.exists()
+    assert dest_rs.read_text() == "fn main() {}"
+    assert dest_md.read_text() == "Task content"
 
 
 @pytest.mark.asyncio
@@ -93,13 +98,15 @@ async def test_create_mod_files(tmp_path):
     dest_root.mkdir()
 
     first_mapping = PathMapping(
-        source=tmp_path / "First", dest=dest_root / "first_module"
+        source=str(tmp_path / "First"), dest=str(dest_root / "first_module")
     )
     second_mapping = PathMapping(
-        source=tmp_path / "Second", dest=first_mapping.dest / "second_module"
+        source=str(tmp_path / "Second"),
+        dest=os.path.join(first_mapping.dest, "second_module"),
     )
     third_mapping = PathMapping(
-        source=tmp_path / "Third", dest=second_mapping.dest / "third_module"
+        source=str(tmp_path / "Third"),
+        dest=os.path.join(second_mapping.dest, "third_module"),
     )
 
     dirs_struct = DirectoriesStructure(
@@ -107,11 +114,11 @@ async def test_create_mod_files(tmp_path):
     )
     await create_mod_files(dirs_struct, dry_run=False)
 
-    mod_file = first_mapping.dest / "mod.rs"
+    mod_file = Path(first_mapping.dest) / "mod.rs"
     assert mod_file.exists()
     content = mod_file.read_text()
-    assert f"pub mod {second_mapping.dest.name}" in content
-    assert f"    pub mod {third_mapping.dest.name};" in content
+    assert f"pub mod {os.path.basename(second_mapping.dest)}" in content
+    assert f"    pub mod {os.path.basename(third_mapping.dest)};" in content
 
 
 @pytest.mark.asyncio
@@ -121,13 +128,15 @@ async def test_create_main_file(tmp_path):
     dest_root.mkdir()
 
     first_mapping = PathMapping(
-        source=tmp_path / "First", dest=dest_root / "first_module"
+        source=str(tmp_path / "First"), dest=str(dest_root / "first_module")
     )
     second_mapping = PathMapping(
-        source=tmp_path / "Second", dest=first_mapping.dest / "second_module"
+        source=str(tmp_path / "Second"),
+        dest=os.path.join(first_mapping.dest, "second_module"),
     )
     third_mapping = PathMapping(
-        source=tmp_path / "Third", dest=second_mapping.dest / "third_module"
+        source=str(tmp_path / "Third"),
+        dest=os.path.join(second_mapping.dest, "third_module"),
     )
 
     dirs_struct = DirectoriesStructure(
@@ -140,14 +149,14 @@ async def test_create_main_file(tmp_path):
     assert main_file.exists()
     content = main_file.read_text()
 
+    first_name = os.path.basename(first_mapping.dest)
+    second_name = os.path.basename(second_mapping.dest)
+    third_name = os.path.basename(third_mapping.dest)
     assert "#![allow(dead_code)]" in content
-    assert f"mod {first_mapping.dest.name};" in content
-    assert f"    // {first_mapping.source.name.upper()}" in content
-    assert f"    // {second_mapping.source.name.upper()}" in content
-    assert (
-        f"    // {first_mapping.dest.name}::{second_mapping.dest.name}::{third_mapping.dest.name}::main();"
-        in content
-    )
+    assert f"mod {first_name};" in content
+    assert f"    // {os.path.basename(first_mapping.source).upper()}" in content
+    assert f"    // {os.path.basename(second_mapping.source).upper()}" in content
+    assert f"    // {first_name}::{second_name}::{third_name}::main();" in content
 
 
 @pytest.mark.asyncio
@@ -162,11 +171,10 @@ async def test_write_to_file(tmp_path):
     assert test_file.read_text() == content
 
 
-@pytest.mark.asyncio
-async def test_file_exists(tmp_path):
+def test_file_exists(tmp_path):
     """Test file existence check."""
     test_file = tmp_path / "test_file.rs"
     test_file.write_text("fn main() {}")
 
-    assert await file_exists(test_file) is True
-    assert await file_exists(tmp_path / "non_existent.rs") is False
+    assert file_exists(test_file) is True
+    assert file_exists(tmp_path / "non_existent.rs") is False